@@ -4,11 +4,86 @@ Password and Security Module for PDF Diary Generator
 Handles secure password input and PDF encryption setup
 """
 
+import collections
 import getpass
 import hashlib
+import hmac
 import secrets
 from reportlab.lib import pdfencrypt
 
+# Character classes and weak patterns used by the strength check
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_COMMON_PATTERNS = ('123', 'abc', 'password', 'qwerty', '111', '000')
+
+
+def _build_pattern_dfa(patterns):
+    """
+    Build an Aho-Corasick automaton for patterns, flattened into a DFA
+
+    Returns (transitions, terminal): transitions[state] maps a character to
+    the next state (missing characters go back to state 0), and
+    terminal[state] is True once any pattern has been seen.
+    """
+    # Trie of all patterns
+    goto = [{}]
+    terminal = [False]
+    for pattern in patterns:
+        state = 0
+        for ch in pattern:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto.append({})
+                terminal.append(False)
+                goto[state][ch] = nxt
+            state = nxt
+        terminal[state] = True
+
+    # Breadth-first, fold each state's failure link into its transitions so
+    # matching never has to backtrack
+    fail = [0] * len(goto)
+    transitions = [dict(edges) for edges in goto]
+    queue = collections.deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        link = fail[state]
+        terminal[state] = terminal[state] or terminal[link]
+        for ch, nxt in transitions[link].items():
+            transitions[state].setdefault(ch, nxt)
+        for ch, child in goto[state].items():
+            if state:
+                fail[child] = transitions[link].get(ch, 0)
+            queue.append(child)
+
+    return tuple(transitions), tuple(terminal)
+
+# One pass over the password finds any blocklisted pattern, however many
+# patterns there are
+_PATTERN_TRANSITIONS, _PATTERN_TERMINAL = _build_pattern_dfa(_COMMON_PATTERNS)
+
+
+def _contains_common_pattern(text):
+    """Check whether text contains any of the common weak patterns"""
+    transitions, terminal = _PATTERN_TRANSITIONS, _PATTERN_TERMINAL
+    state = 0
+    for ch in text:
+        state = transitions[state].get(ch, 0)
+        if terminal[state]:
+            return True
+    return False
+
+# Bit flags for the character classes, and a bytes.translate table mapping
+# each ASCII byte to its class bit (non-ASCII bytes map to 0)
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+_CLASS_TABLE = bytes(
+    _UPPER if ch.isupper() else
+    _LOWER if ch.islower() else
+    _DIGIT if ch.isdigit() else
+    _SPECIAL if ch in _SPECIAL_CHARS else 0
+    for ch in map(chr, range(128))
+) + bytes(128)
+
 class PasswordManager:
     """Handle password operations and validation"""
 
@@ -17,6 +92,8 @@ class PasswordManager:
         """
         Get password from user with confirmation and validation
 
+        The confirmation is checked with a constant-time comparison.
+
         Args:
             min_length (int): Minimum password length
             max_attempts (int): Maximum number of attempts before giving up
@@ -27,6 +104,11 @@ class PasswordManager:
         Raises:
             ValueError: If password requirements not met after max attempts
         """
+        def notify_retry(attempts):
+            """Tell the user how many attempts remain, if any"""
+            if attempts < max_attempts:
+                print(f"Please try again ({max_attempts - attempts} attempts remaining)")
+
         attempts = 0
 
         while attempts < max_attempts:
@@ -38,24 +120,22 @@ class PasswordManager:
                 # Validate password length
                 if len(password) < min_length:
                     print(f"❌ Password must be at least {min_length} characters long.")
-                    if attempts < max_attempts:
-                        print(f"Please try again ({max_attempts - attempts} attempts remaining)")
+                    notify_retry(attempts)
                     continue
 
                 # Check for empty password
                 if not password.strip():
                     print("❌ Password cannot be empty or just whitespace.")
-                    if attempts < max_attempts:
-                        print(f"Please try again ({max_attempts - attempts} attempts remaining)")
+                    notify_retry(attempts)
                     continue
 
                 # Confirm password
                 confirm_password = getpass.getpass("Confirm password: ")
 
-                if password != confirm_password:
+                if not hmac.compare_digest(password.encode('utf-8'),
+                                           confirm_password.encode('utf-8')):
                     print("❌ Passwords do not match.")
-                    if attempts < max_attempts:
-                        print(f"Please try again ({max_attempts - attempts} attempts remaining)")
+                    notify_retry(attempts)
                     continue
 
                 # Password validation passed
@@ -66,8 +146,7 @@ class PasswordManager:
                 raise ValueError("Password entry cancelled")
             except Exception as e:
                 print(f"❌ Error during password entry: {e}")
-                if attempts < max_attempts:
-                    print(f"Please try again ({max_attempts - attempts} attempts remaining)")
+                notify_retry(attempts)
                 continue
 
         # Max attempts reached
@@ -93,11 +172,31 @@ class PasswordManager:
             if len(password) < 6:
                 is_strong = False
 
-        # Check character variety
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+        # Check character variety in a single pass
+        mask = 0
+        if password.isascii():
+            # Classify every byte in C, then OR together the distinct classes
+            for bits in set(password.encode('ascii').translate(_CLASS_TABLE)):
+                mask |= bits
+        else:
+            # Special characters are all ASCII, so only letters and digits
+            # need the Unicode-aware checks; stop once every class is seen
+            for c in password:
+                if c < '\x80':
+                    mask |= _CLASS_TABLE[ord(c)]
+                elif c.isupper():
+                    mask |= _UPPER
+                elif c.islower():
+                    mask |= _LOWER
+                elif c.isdigit():
+                    mask |= _DIGIT
+                if mask == _ALL_CLASSES:
+                    break
+
+        has_upper = bool(mask & _UPPER)
+        has_lower = bool(mask & _LOWER)
+        has_digit = bool(mask & _DIGIT)
+        has_special = bool(mask & _SPECIAL)
 
         char_types = sum([has_upper, has_lower, has_digit, has_special])
 
@@ -108,8 +207,8 @@ class PasswordManager:
             feedback.append("💡 Good! Consider adding more character variety for extra security")
 
         # Check for common patterns
-        common_patterns = ['123', 'abc', 'password', 'qwerty', '111', '000']
-        if any(pattern in password.lower() for pattern in common_patterns):
+        pw_lower = password.lower()
+        if _contains_common_pattern(pw_lower):
             feedback.append("⚠️  Avoid common patterns like '123', 'abc', or 'password'")
             is_strong = False
 
@@ -223,5 +322,9 @@ def hash_password_for_filename(password):
     """
     Create a short hash of password for unique filename generation
     (Not for security - just to create unique filenames)
+
+    Accepts either str or bytes; bytes are hashed as-is.
     """
-    return hashlib.md5(password.encode()).hexdigest()[:8]
+    if not isinstance(password, (bytes, bytearray)):
+        password = password.encode('utf-8')
+    return hashlib.blake2b(password, digest_size=4).hexdigest()
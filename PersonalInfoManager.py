@@ -7,9 +7,59 @@ Usage: Import and integrate with DiaryGenerator
 
 from reportlab.lib.colors import Color, white
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
 import calendar
+import functools
+from dataclasses import dataclass
 from datetime import date
 
+from SeasonalTheme import SeasonalTheme
+
+
+# Shared fill colors; Color objects are never mutated once created
+_TRANSPARENT_FILL = Color(0, 0, 0, 0.0)  # alpha 0, so the RGB is never used
+_INSTRUCTION_GREY = Color(0.6, 0.6, 0.6)
+
+# Form pages: (title, instruction, fields key, bookmark, page number)
+_PAGE_SPECS = [
+    ("Personal Information - Basic Details",
+     "Please fill in your basic personal information below:",
+     'page1', "personal_info_1", 1),
+    ("Personal Information - Medical & Official",
+     "Please fill in your medical and official document information:",
+     'page2', "personal_info_2", 2),
+]
+
+# Page 3 instructions; bullet lines are indented, the rest centered
+_PAGE3_INSTRUCTIONS = [
+    "This page is reserved for important documents and photos.",
+    "You can print and attach copies of:",
+    "• Passport/ID copies",
+    "• Insurance cards",
+    "• Medical information cards",
+    "• Emergency contact cards",
+    "• Personal photos",
+    "• Any other important documents"
+]
+
+
+@dataclass(slots=True)
+class PageCtx:
+    """Page-invariant state shared by all personal info pages"""
+    colors: dict
+    month: int
+    season: str
+    tab_x: float
+    tab_y: float
+    tab_w: float
+    tab_h: float
+
+
+@functools.lru_cache(maxsize=512)
+def _string_width(text, font_name, font_size):
+    """Width of a fixed label/title string, measured once per font and size"""
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
 
 class PersonalInfoManager:
     """Handle personal information pages for the diary"""
@@ -25,6 +75,22 @@ class PersonalInfoManager:
         self.width = diary_generator.width
         self.height = diary_generator.height
         
+        # Personal info pages are themed on the current month's season,
+        # which does not change while the diary is being generated
+        today_month = date.today().month
+        season = SeasonalTheme.get_season(today_month)
+        tab_width = 83
+        tab_height = 45
+        self._ctx = PageCtx(
+            colors=SeasonalTheme.get_colors(season),
+            month=today_month,
+            season=season,
+            tab_x=self.width - tab_width - 10,
+            tab_y=self.height - 15,  # Above the month tabs
+            tab_w=tab_width,
+            tab_h=tab_height,
+        )
+        
         # Personal info form fields organized by page
         self.personal_info_fields = {
             'page1': [
@@ -62,20 +128,55 @@ class PersonalInfoManager:
                 ("Social Security/ID Number", "ssn_id"),
             ]
         }
+        
+        # Per-page form rows laid out once as parallel lists
+        self._page_tables = {
+            key: self._build_form_table(fields, self.height - 150)
+            for key, fields in self.personal_info_fields.items()
+        }
+        
+        # Page 3 instruction lines as (text, font, size, x, y)
+        self._page3_lines = []
+        y_pos = self.height - 130
+        for instruction in _PAGE3_INSTRUCTIONS:
+            if instruction.startswith("•"):
+                font, size, x = "DancingScript-Regular", 12, 100
+            else:
+                font, size = "DancingScript-Regular", 14
+                x = (self.width - _string_width(instruction, font, size)) / 2
+            self._page3_lines.append((instruction, font, size, x, y_pos))
+            y_pos -= 25
+    
+    @staticmethod
+    def _build_form_table(fields, start_y, row_height=35, min_y=100):
+        """
+        Precompute the rows of a form table as parallel lists
+        
+        Rows that would fall below min_y are dropped, matching the
+        page-overflow cut-off of the drawing loop.
+        """
+        table = {'labels_colon': [], 'field_names': [], 'tooltips': [], 'ys': []}
+        current_y = start_y
+        for label, field_name in fields:
+            table['labels_colon'].append(label + ":")
+            table['field_names'].append(field_name)
+            table['tooltips'].append(f'Enter your {label.lower()}')
+            table['ys'].append(current_y)
+            current_y -= row_height
+            if current_y < min_y:
+                break
+        table['next_y'] = current_y
+        return table
     
     def draw_personal_info_tab(self, c, current_page=None):
         """Draw the personal info tab on the right side"""
         # Personal info tab positioned above month tabs
-        tab_width = 83
-        tab_height = 45
-        start_x = self.width - tab_width - 10
-        start_y = self.height - 15  # Above the month tabs
+        ctx = self._ctx
+        start_x, start_y = ctx.tab_x, ctx.tab_y
+        tab_width, tab_height = ctx.tab_w, ctx.tab_h
         
         # Use current month's season for tab coloring
-        current_month = date.today().month
-        from enhanced_diary import SeasonalTheme
-        season = SeasonalTheme.get_season(current_month)
-        colors = SeasonalTheme.get_colors(season)
+        colors = ctx.colors
         
         # Highlight if on personal info page
         if current_page and current_page.startswith('personal'):
@@ -90,11 +191,11 @@ class PersonalInfoManager:
         c.setFillColor(colors["text"])
         c.setFont("DancingScript-Bold", 10)
         text = "Personal"
-        text_width = c.stringWidth(text, "DancingScript-Bold", 10)
+        text_width = _string_width(text, "DancingScript-Bold", 10)
         c.drawString(start_x + (tab_width - text_width) / 2, start_y + 25, text)
         
         text2 = "Info"
-        text2_width = c.stringWidth(text2, "DancingScript-Bold", 10)
+        text2_width = _string_width(text2, "DancingScript-Bold", 10)
         c.drawString(start_x + (tab_width - text2_width) / 2, start_y + 10, text2)
         
         # Add link annotation
@@ -103,33 +204,33 @@ class PersonalInfoManager:
     
     def draw_page_navigation(self, c, current_page_num):
         """Draw navigation between personal info pages"""
+        ctx = self._ctx
         nav_y = 50
         nav_spacing = 100
         center_x = self.width / 2
         
         # Get current month's colors
-        current_month = date.today().month
-        from enhanced_diary import SeasonalTheme
-        season = SeasonalTheme.get_season(current_month)
-        colors = SeasonalTheme.get_colors(season)
+        colors = ctx.colors
         
         # Page indicators and navigation
         pages = ["Page 1", "Page 2", "Page 3"]
         page_links = ["personal_info_1", "personal_info_2", "personal_info_3"]
         
-        for i, (page_text, page_link) in enumerate(zip(pages, page_links)):
+        # Per-page style (font, size, fill, is current page); only the
+        # current page's entry differs
+        styles = [("DancingScript-Regular", 12, colors["primary"], False)] * len(pages)
+        styles[current_page_num - 1] = ("DancingScript-Bold", 14, colors["accent"], True)
+        
+        for i, (page_text, page_link, (font, size, fill, is_current)) in enumerate(
+                zip(pages, page_links, styles)):
             x = center_x + (i - 1) * nav_spacing
             
             # Current page styling
-            if i + 1 == current_page_num:
-                c.setFillColor(colors["accent"])
-                c.setFont("DancingScript-Bold", 14)
-            else:
-                c.setFillColor(colors["primary"])
-                c.setFont("DancingScript-Regular", 12)
+            c.setFillColor(fill)
+            c.setFont(font, size)
             
             # Draw page indicator
-            text_width = c.stringWidth(page_text, "DancingScript-Bold" if i + 1 == current_page_num else "DancingScript-Regular", 14 if i + 1 == current_page_num else 12)
+            text_width = _string_width(page_text, font, size)
             c.rect(x - text_width/2 - 10, nav_y - 5, text_width + 20, 25, fill=1, stroke=1)
             
             # Add text
@@ -137,7 +238,7 @@ class PersonalInfoManager:
             c.drawString(x - text_width/2, nav_y + 5, page_text)
             
             # Add link if not current page
-            if i + 1 != current_page_num:
+            if not is_current:
                 c.linkRect("", page_link, (x - text_width/2 - 10, nav_y - 5, x + text_width/2 + 10, nav_y + 20))
         
         # Navigation arrows
@@ -148,154 +249,121 @@ class PersonalInfoManager:
             prev_text = "← Previous"
             c.drawString(50, nav_y + 5, prev_text)
             prev_link = f"personal_info_{current_page_num - 1}"
-            c.linkRect("", prev_link, (50, nav_y, 50 + c.stringWidth(prev_text, "DancingScript-Bold", 16), nav_y + 20))
+            c.linkRect("", prev_link, (50, nav_y, 50 + _string_width(prev_text, "DancingScript-Bold", 16), nav_y + 20))
         
         if current_page_num < 3:
             # Next arrow
             c.setFont("DancingScript-Bold", 16)
             c.setFillColor(colors["accent"])
             next_text = "Next →"
-            next_width = c.stringWidth(next_text, "DancingScript-Bold", 16)
+            next_width = _string_width(next_text, "DancingScript-Bold", 16)
             c.drawString(self.width - 90 - next_width, nav_y + 5, next_text)
             next_link = f"personal_info_{current_page_num + 1}"
             c.linkRect("", next_link, (self.width - 90 - next_width, nav_y, self.width - 90, nav_y + 20))
     
-    def create_form_table(self, c, fields, start_y, colors):
+    def create_form_table(self, c, table, colors):
         """Create a two-column form table with labels and input fields"""
-        row_height = 35
         label_width = 180
         field_width = 250
         start_x = 50
         field_x = start_x + label_width + 20
         
-        current_y = start_y
+        # Whether the canvas supports form fields is a property of the canvas,
+        # so probe once and pick the field renderer before the loop
+        def _draw_acro(field_name, tooltip, current_y):
+            c.acroForm.textfield(
+                name=field_name,
+                tooltip=tooltip,
+                x=field_x, y=current_y,
+                width=field_width, height=25,
+                borderStyle='inset',
+                forceBorder=True,
+                fontName='Helvetica',
+                fontSize=10,
+                textColor=colors["text"],
+                fillColor=_TRANSPARENT_FILL,
+                borderWidth=1
+                # Remove fieldFlags parameter - not needed for basic text fields
+            )
         
-        for label, field_name in fields:
+        def _draw_fallback(field_name, tooltip, current_y):
+            # Fallback: Draw visual input field
+            c.setFillColor(colors["primary"])
+            c.setStrokeColor(colors["accent"])
+            c.setLineWidth(1)
+            c.rect(field_x, current_y, field_width, 25, fill=1, stroke=1)
+        
+        draw_field = _draw_acro if hasattr(c, 'acroForm') else _draw_fallback
+        
+        # All labels share one font and color, so emit them as one text object
+        labels = c.beginText()
+        labels.setFont("DancingScript-Bold", 12)
+        labels.setFillColor(colors["text"])
+        
+        for label_colon, field_name, tooltip, current_y in zip(
+                table['labels_colon'], table['field_names'], table['tooltips'], table['ys']):
             # Draw label
-            c.setFillColor(colors["text"])
-            c.setFont("DancingScript-Bold", 12)
-            c.drawString(start_x, current_y + 10, label + ":")
+            labels.setTextOrigin(start_x, current_y + 10)
+            labels.textOut(label_colon)
             
             # Create form field
-            try:
-                tr = Color(100, 0, 0, 0.0)
-                c.acroForm.textfield(
-                    name=field_name,
-                    tooltip=f'Enter your {label.lower()}',
-                    x=field_x, y=current_y,
-                    width=field_width, height=25,
-                    borderStyle='inset',
-                    forceBorder=True,
-                    fontName='Helvetica',
-                    fontSize=10,
-                    textColor=colors["text"],
-                    fillColor=tr,
-                    borderWidth=1
-                    # Remove fieldFlags parameter - not needed for basic text fields
-                )
-            except AttributeError:
-                # Fallback: Draw visual input field
-                c.setFillColor(colors["primary"])
-                c.setStrokeColor(colors["accent"])
-                c.setLineWidth(1)
-                c.rect(field_x, current_y, field_width, 25, fill=1, stroke=1)
-            
-            current_y -= row_height
-            
-            # Check if we need to move to next page
-            if current_y < 100:
-                break
+            draw_field(field_name, tooltip, current_y)
+        
+        c.drawText(labels)
         
-        return current_y
+        return table['next_y']
     
-    def create_personal_info_page_1(self, c):
-        """Create the first personal info page with basic information"""
+    def _create_form_page(self, c, title, instruction, fields_key, bookmark, page_num):
+        """Create a personal info page holding a two-column form table"""
+        ctx = self._ctx
         # Get current month's colors for theming
-        current_month = date.today().month
-        from enhanced_diary import SeasonalTheme
-        season = SeasonalTheme.get_season(current_month)
-        colors = SeasonalTheme.get_colors(season)
+        colors = ctx.colors
         
         # Draw seasonal background
-#        self.diary_gen.draw_seasonal_background(c, current_month)
+#        self.diary_gen.draw_seasonal_background(c, ctx.month)
         
         # Draw tabs
         self.diary_gen.draw_month_tabs(c)
-        self.draw_personal_info_tab(c, "personal_info_1")
+        self.draw_personal_info_tab(c, bookmark)
         
         # Add bookmark
-        c.bookmarkPage("personal_info_1")
+        c.bookmarkPage(bookmark)
         
         # Title
         c.setFillColor(colors["text"])
         c.setFont("DancingScript-Bold", 28)
-        title = "Personal Information - Basic Details"
-        title_width = c.stringWidth(title, "DancingScript-Bold", 28)
+        title_width = _string_width(title, "DancingScript-Bold", 28)
         c.drawString((self.width - title_width) / 2, self.height - 80, title)
         
         # Instructions
         c.setFont("DancingScript-Regular", 12)
-        instruction = "Please fill in your basic personal information below:"
-        inst_width = c.stringWidth(instruction, "DancingScript-Regular", 12)
+        inst_width = _string_width(instruction, "DancingScript-Regular", 12)
         c.drawString((self.width - inst_width) / 2, self.height - 110, instruction)
         
         # Create form table
-        self.create_form_table(c, self.personal_info_fields['page1'], self.height - 150, colors)
+        self.create_form_table(c, self._page_tables[fields_key], colors)
         
         # Navigation
-        self.draw_page_navigation(c, 1)
+        self.draw_page_navigation(c, page_num)
         
         c.showPage()
     
+    def create_personal_info_page_1(self, c):
+        """Create the first personal info page with basic information"""
+        self._create_form_page(c, *_PAGE_SPECS[0])
+    
     def create_personal_info_page_2(self, c):
         """Create the second personal info page with medical and official information"""
-        # Get current month's colors for theming
-        current_month = date.today().month
-        from enhanced_diary import SeasonalTheme
-        season = SeasonalTheme.get_season(current_month)
-        colors = SeasonalTheme.get_colors(season)
-        
-        # Draw seasonal background
-#        self.diary_gen.draw_seasonal_background(c, current_month)
-        
-        # Draw tabs
-        self.diary_gen.draw_month_tabs(c)
-        self.draw_personal_info_tab(c, "personal_info_2")
-        
-        # Add bookmark
-        c.bookmarkPage("personal_info_2")
-        
-        # Title
-        c.setFillColor(colors["text"])
-        c.setFont("DancingScript-Bold", 28)
-        title = "Personal Information - Medical & Official"
-        title_width = c.stringWidth(title, "DancingScript-Bold", 28)
-        c.drawString((self.width - title_width) / 2, self.height - 80, title)
-        
-        # Instructions
-        c.setFont("DancingScript-Regular", 12)
-        instruction = "Please fill in your medical and official document information:"
-        inst_width = c.stringWidth(instruction, "DancingScript-Regular", 12)
-        c.drawString((self.width - inst_width) / 2, self.height - 110, instruction)
-        
-        # Create form table
-        self.create_form_table(c, self.personal_info_fields['page2'], self.height - 150, colors)
-        
-        # Navigation
-        self.draw_page_navigation(c, 2)
-        
-        c.showPage()
+        self._create_form_page(c, *_PAGE_SPECS[1])
     
     def create_personal_info_page_3(self, c):
         """Create the third personal info page for documents and photos"""
+        ctx = self._ctx
         # Get current month's colors for theming
-        current_month = date.today().month
-        from enhanced_diary import SeasonalTheme
-        season = SeasonalTheme.get_season(current_month)
-        colors = SeasonalTheme.get_colors(season)
+        colors = ctx.colors
         
         # Draw seasonal background
-#        self.diary_gen.draw_seasonal_background(c, current_month)
+#        self.diary_gen.draw_seasonal_background(c, ctx.month)
         
         # Draw tabs
         self.diary_gen.draw_month_tabs(c)
@@ -308,33 +376,14 @@ class PersonalInfoManager:
         c.setFillColor(colors["text"])
         c.setFont("DancingScript-Bold", 28)
         title = "Personal Information - Documents & Photos"
-        title_width = c.stringWidth(title, "DancingScript-Bold", 28)
+        title_width = _string_width(title, "DancingScript-Bold", 28)
         c.drawString((self.width - title_width) / 2, self.height - 80, title)
         
         # Instructions
-        c.setFont("DancingScript-Regular", 14)
         c.setFillColor(colors["text"])
-        instructions = [
-            "This page is reserved for important documents and photos.",
-            "You can print and attach copies of:",
-            "• Passport/ID copies",
-            "• Insurance cards", 
-            "• Medical information cards",
-            "• Emergency contact cards",
-            "• Personal photos",
-            "• Any other important documents"
-        ]
-        
-        y_pos = self.height - 130
-        for instruction in instructions:
-            if instruction.startswith("•"):
-                c.setFont("DancingScript-Regular", 12)
-                c.drawString(100, y_pos, instruction)
-            else:
-                c.setFont("DancingScript-Regular", 14)
-                inst_width = c.stringWidth(instruction, "DancingScript-Regular", 14)
-                c.drawString((self.width - inst_width) / 2, y_pos, instruction)  # FIXED: Added instruction parameter
-            y_pos -= 25
+        for text, font, size, x, y in self._page3_lines:
+            c.setFont(font, size)
+            c.drawString(x, y, text)
         
         # Create document areas
         doc_areas = [
@@ -365,14 +414,14 @@ class PersonalInfoManager:
             # Add area label
             c.setFillColor(colors["text"])
             c.setFont("DancingScript-Bold", 14)
-            label_width = c.stringWidth(area_name, "DancingScript-Bold", 14)
+            label_width = _string_width(area_name, "DancingScript-Bold", 14)
             c.drawString(x + (area_width - label_width) / 2, y + area_height + 10, area_name)
             
             # Add instruction text
             c.setFont("DancingScript-Regular", 10)
             inst_text = "Attach documents here"
-            inst_width = c.stringWidth(inst_text, "DancingScript-Regular", 10)
-            c.setFillColor(Color(0.6, 0.6, 0.6))
+            inst_width = _string_width(inst_text, "DancingScript-Regular", 10)
+            c.setFillColor(_INSTRUCTION_GREY)
             c.drawString(x + (area_width - inst_width) / 2, y + area_height / 2, inst_text)
         
         # Large text area for additional notes
@@ -380,8 +429,7 @@ class PersonalInfoManager:
         c.setFont("DancingScript-Bold", 16)
         c.drawString(50, 200, "Additional Notes:")
         
-        try:
-            tr = Color(100, 0, 0, 0.0)
+        if hasattr(c, 'acroForm'):
             c.acroForm.textfield(
                 name='personal_additional_notes',
                 tooltip='Additional personal information or notes',
@@ -392,11 +440,11 @@ class PersonalInfoManager:
                 fontName='Helvetica',
                 fontSize=10,
                 textColor=colors["text"],
-                fillColor=tr,
+                fillColor=_TRANSPARENT_FILL,
                 borderWidth=1,
                 fieldFlags='multiline'
             )
-        except AttributeError:
+        else:
             # Fallback
             c.setFillColor(colors["primary"])
             c.setStrokeColor(colors["accent"])
@@ -409,8 +457,10 @@ class PersonalInfoManager:
     
     def generate_all_personal_info_pages(self, c):
         """Generate all three personal information pages"""
-        self.create_personal_info_page_1(c)
-        self.create_personal_info_page_2(c)
+        # Month, season, palette and tab geometry are shared by every page
+        # through self._ctx, built once in __init__
+        for spec in _PAGE_SPECS:
+            self._create_form_page(c, *spec)
         self.create_personal_info_page_3(c)
   #      print("✓ Personal information pages created with form fields and navigation")
 
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Seasonal Theme Module for Digital Diary
+Defines the seasonal color palettes shared by the diary and personal info pages
+"""
+
+from reportlab.lib.colors import Color
+
+
+# Season for each month number (index 0 unused)
+_MONTH_TO_SEASON = (None,
+                    "winter", "winter", "spring", "spring", "spring", "summer",
+                    "summer", "summer", "autumn", "autumn", "autumn", "winter")
+
+# Color palette for each season
+_SEASON_COLORS = {
+    "winter": {
+        "primary": Color(0.8, 0.9, 1.0),      # Light blue
+        "secondary": Color(0.9, 0.95, 1.0),   # Very light blue
+        "accent": Color(0.4, 0.6, 0.9),       # Medium blue
+        "text": Color(0.2, 0.3, 0.5)          # Dark blue
+    },
+    "spring": {
+        "primary": Color(0.9, 1.0, 0.9),      # Light green
+        "secondary": Color(0.95, 1.0, 0.95),  # Very light green
+        "accent": Color(0.5, 0.8, 0.5),       # Medium green
+        "text": Color(0.2, 0.5, 0.3)          # Dark green
+    },
+    "summer": {
+        "primary": Color(1.0, 0.95, 0.8),     # Light yellow
+        "secondary": Color(1.0, 0.98, 0.9),   # Very light yellow
+        "accent": Color(1.0, 0.7, 0.3),       # Orange
+        "text": Color(0.6, 0.4, 0.2)          # Brown
+    },
+    "autumn": {
+        "primary": Color(1.0, 0.9, 0.8),      # Light orange
+        "secondary": Color(1.0, 0.95, 0.9),   # Very light orange
+        "accent": Color(0.9, 0.5, 0.3),       # Dark orange
+        "text": Color(0.5, 0.3, 0.2)          # Dark brown
+    }
+}
+
+
+class SeasonalTheme:
+    """Define seasonal color themes"""
+
+    @staticmethod
+    def get_season(month):
+        """Get season based on month (Northern Hemisphere)"""
+        return _MONTH_TO_SEASON[month]
+
+    @staticmethod
+    def get_colors(season):
+        """Get color palette for season"""
+        return _SEASON_COLORS[season]
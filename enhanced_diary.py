@@ -2,25 +2,35 @@
 """
 Enhanced Digital Diary Generator - With Seasonal Backgrounds and Holidays
 Creates an interactive PDF diary with seasonal themes, backgrounds, and holiday support
-Usage: python enhanced_diary.py <year>
+Usage: python enhanced_diary.py <year> [--verbose]
 """
 
 import sys
 import calendar
+import functools
+import itertools
+import math
 from datetime import datetime, date
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.colors import Color, black, white
-from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase import pdfdoc, pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch, mm
+from reportlab.lib.utils import ImageReader
 import random
 
 from PasswordManager import get_secure_password_for_diary
 from PersonalInfoManager import PersonalInfoManager
+from SeasonalTheme import SeasonalTheme
 import os
+from reportlab import rl_config
+
+# Leave compressed streams as raw binary instead of ASCII85 text. ReportLab reads
+# this when the PDF is written, so it covers library callers as well as main()
+rl_config.useA85 = 0
 
 
 # Register multiple variants
@@ -28,62 +38,83 @@ import os
 # ----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------
 # Holiday definitions
 
+def _weekday(year, month, day):
+    """Day of the week (Monday=0) by Zeller's congruence, without building a date"""
+    if month < 3:
+        # Zeller counts January and February as months 13 and 14 of the previous year
+        month += 12
+        year -= 1
+    k, j = year % 100, year // 100
+    h = (day + 13 * (month + 1) // 5 + k + k // 4 + j // 4 + 5 * j) % 7
+    # h is 0 for Saturday; shift so Monday is 0
+    return (h + 5) % 7
+
+def _nth_weekday(year, month, weekday, n):
+    """Day of month of the n-th given weekday (Monday=0) in a month"""
+    first_weekday = _weekday(year, month, 1)
+    return 1 + (weekday - first_weekday) % 7 + 7 * (n - 1)
+
 def get_us_holidays(year):
     """Get US Federal Holidays for a given year"""
-    holidays = {}
-
-    # Fixed date holidays
-    holidays[date(year, 1, 1)] = "New Year's Day"
-    holidays[date(year, 7, 4)] = "Independence Day"
-    holidays[date(year, 11, 11)] = "Veterans Day"
-    holidays[date(year, 12, 25)] = "Christmas Day"
-
-    # MLK Day - Third Monday in January
-    jan_1 = date(year, 1, 1)
-    days_to_monday = (7 - jan_1.weekday()) % 7
-    first_monday = jan_1.replace(day=1 + days_to_monday)
-    mlk_day = first_monday.replace(day=first_monday.day + 14)  # Third Monday
-    holidays[mlk_day] = "Martin Luther King Jr. Day"
-
-    # Presidents Day - Third Monday in February
-    feb_1 = date(year, 2, 1)
-    days_to_monday = (7 - feb_1.weekday()) % 7
-    first_monday = feb_1.replace(day=1 + days_to_monday)
-    presidents_day = first_monday.replace(day=first_monday.day + 14)  # Third Monday
-    holidays[presidents_day] = "Presidents Day"
+    # Copy the cached table so callers can't change it for later lookups
+    return dict(_us_holidays(year))
 
+@functools.lru_cache(maxsize=None)
+def _us_holidays(year):
+    """US Federal Holidays for a year, computed once per year"""
     # Memorial Day - Last Monday in May
-    may_31 = date(year, 5, 31)
-    days_back_to_monday = (may_31.weekday() + 1) % 7
-    memorial_day = may_31.replace(day=31 - days_back_to_monday)
-    holidays[memorial_day] = "Memorial Day"
-
-    # Labor Day - First Monday in September
-    sep_1 = date(year, 9, 1)
-    days_to_monday = (7 - sep_1.weekday()) % 7
-    labor_day = sep_1.replace(day=1 + days_to_monday)
-    holidays[labor_day] = "Labor Day"
-
-    # Columbus Day - Second Monday in October
-    oct_1 = date(year, 10, 1)
-    days_to_monday = (7 - oct_1.weekday()) % 7
-    first_monday = oct_1.replace(day=1 + days_to_monday)
-    columbus_day = first_monday.replace(day=first_monday.day + 7)  # Second Monday
-    holidays[columbus_day] = "Columbus Day"
-
-    # Thanksgiving - Fourth Thursday in November
-    nov_1 = date(year, 11, 1)
-    days_to_thursday = (3 - nov_1.weekday()) % 7
-    first_thursday = nov_1.replace(day=1 + days_to_thursday)
-    thanksgiving = first_thursday.replace(day=first_thursday.day + 21)  # Fourth Thursday
-    holidays[thanksgiving] = "Thanksgiving Day"
-
-    return holidays
+    memorial_day = 31 - _weekday(year, 5, 31)
+
+    return {
+        # Fixed date holidays
+        date(year, 1, 1): "New Year's Day",
+        date(year, 7, 4): "Independence Day",
+        date(year, 11, 11): "Veterans Day",
+        date(year, 12, 25): "Christmas Day",
+        # Floating holidays
+        date(year, 1, _nth_weekday(year, 1, 0, 3)): "Martin Luther King Jr. Day",
+        date(year, 2, _nth_weekday(year, 2, 0, 3)): "Presidents Day",
+        date(year, 5, memorial_day): "Memorial Day",
+        date(year, 9, _nth_weekday(year, 9, 0, 1)): "Labor Day",
+        date(year, 10, _nth_weekday(year, 10, 0, 2)): "Columbus Day",
+        date(year, 11, _nth_weekday(year, 11, 3, 4)): "Thanksgiving Day",
+    }
 
 def is_weekend(date_obj):
     """Check if a date is a weekend (Saturday=5, Sunday=6)"""
     return date_obj.weekday() >= 5
 
+@functools.lru_cache(maxsize=512)
+def _wrap_text(text, max_width, font_name, font_size):
+    """Greedily pack words into lines no wider than max_width (cached per text and font)"""
+    words = text.split()
+    if not words:
+        return ()
+    space_width = pdfmetrics.stringWidth(' ', font_name, font_size)
+    lines = []
+    line_start = 0
+    line_width = pdfmetrics.stringWidth(words[0], font_name, font_size)
+
+    for i in range(1, len(words)):
+        word_width = pdfmetrics.stringWidth(words[i], font_name, font_size)
+        if line_width + space_width + word_width <= max_width:
+            line_width += space_width + word_width
+        else:
+            lines.append(' '.join(words[line_start:i]))
+            line_start = i
+            line_width = word_width
+
+    lines.append(' '.join(words[line_start:]))
+    return tuple(lines)
+
+@functools.lru_cache(maxsize=512)
+def _quote_geometry(text, font_name, font_size, page_width, top_y, leading):
+    """(x, y, line) for each line of a quote wrapped to 400pt and centered on the page"""
+    return tuple(
+        ((page_width - pdfmetrics.stringWidth(line, font_name, font_size)) / 2, top_y - i * leading, line)
+        for i, line in enumerate(_wrap_text(text, 400, font_name, font_size))
+    )
+
 # Wisdom quotes for different contexts
 WISDOM_QUOTES = [
     "The journey of a thousand miles begins with one step. - Lao Tzu",
@@ -128,52 +159,6 @@ WISDOM_QUOTES = [
     "Everything you've ever wanted is on the other side of fear. - George Addair"
 ]
 
-class SeasonalTheme:
-    """Define seasonal color themes"""
-
-    @staticmethod
-    def get_season(month):
-        """Get season based on month (Northern Hemisphere)"""
-        if month in [12, 1, 2]:
-            return "winter"
-        elif month in [3, 4, 5]:
-            return "spring"
-        elif month in [6, 7, 8]:
-            return "summer"
-        else:
-            return "autumn"
-
-    @staticmethod
-    def get_colors(season):
-        """Get color palette for season"""
-        themes = {
-            "winter": {
-                "primary": Color(0.8, 0.9, 1.0),      # Light blue
-                "secondary": Color(0.9, 0.95, 1.0),   # Very light blue
-                "accent": Color(0.4, 0.6, 0.9),       # Medium blue
-                "text": Color(0.2, 0.3, 0.5)          # Dark blue
-            },
-            "spring": {
-                "primary": Color(0.9, 1.0, 0.9),      # Light green
-                "secondary": Color(0.95, 1.0, 0.95),  # Very light green
-                "accent": Color(0.5, 0.8, 0.5),       # Medium green
-                "text": Color(0.2, 0.5, 0.3)          # Dark green
-            },
-            "summer": {
-                "primary": Color(1.0, 0.95, 0.8),     # Light yellow
-                "secondary": Color(1.0, 0.98, 0.9),   # Very light yellow
-                "accent": Color(1.0, 0.7, 0.3),       # Orange
-                "text": Color(0.6, 0.4, 0.2)          # Brown
-            },
-            "autumn": {
-                "primary": Color(1.0, 0.9, 0.8),      # Light orange
-                "secondary": Color(1.0, 0.95, 0.9),   # Very light orange
-                "accent": Color(0.9, 0.5, 0.3),       # Dark orange
-                "text": Color(0.5, 0.3, 0.2)          # Dark brown
-            }
-        }
-        return themes[season]
-
 # Define seasonal background image paths
 SEASON_BACKGROUNDS = {
     'winter': 'images/winter_bg.jpg',
@@ -182,31 +167,134 @@ SEASON_BACKGROUNDS = {
     'autumn': 'images/autumn_bg.jpg'
 }
 
+@functools.lru_cache(maxsize=512)
+def _rgba(r, g, b, a=1.0):
+    """Shared Color instance for an RGBA value, so repeated fills reuse one object"""
+    return Color(r, g, b, alpha=a)
+
+# Snowflakes are drawn many times with the same translucent white
+SNOW_WHITE = _rgba(1, 1, 1, 0.4)
+
+@functools.lru_cache(maxsize=None)
+def _hill_points(width, height):
+    """Outline of the summer hills, sampled every 20pt across the page"""
+    return tuple((i, height * 0.3 + 30 * abs((i - width/2) / (width/4)))
+                 for i in range(0, int(width) + 1, 20))
+
+# Gradient sky per season: (base RGB, change in RGB from top to bottom)
+SKY_GRADIENTS = {
+    'winter': ((0.7, 0.8, 0.9), (0.2, 0.15, 0.1)),
+    'spring': ((0.8, 0.9, 0.8), (0.1, 0.05, 0.1)),
+    'summer': ((0.9, 0.85, 0.7), (0.0, 0.1, 0.2)),
+    'autumn': ((0.9, 0.8, 0.7), (0.0, 0.1, 0.1)),
+}
+
+def _end_form(c):
+    """
+    Close a form XObject, declaring the graphics states and forms it uses
+
+    ReportLab gives form XObjects font and image resources but not the
+    ExtGState entries behind alpha fills, so build the dictionary here.
+    """
+    resources = pdfdoc.PDFResourceDictionary()
+    resources.basicFonts()
+    resources.allProcs()
+    ext_gstate = c._extgstate.getState()
+    if ext_gstate:
+        resources.ExtGState = ext_gstate
+    if c._formsinuse:
+        resources.XObject = c._doc.xobjDict(c._formsinuse)
+    c.endForm(Resources=resources)
+
+def _share_form_fonts(acro_form):
+    """
+    Make every form field reuse one font object per font name
+
+    ReportLab's AcroForm writes a fresh font dictionary for each field, so
+    otherwise identical appearance streams never match its dedupe map and
+    every field carries its own stream and /Helv font object.
+    """
+    make_font = acro_form.makeFont
+    fonts = {}
+
+    def shared_make_font(font_name):
+        if font_name not in fonts:
+            fonts[font_name] = make_font(font_name)
+        return fonts[font_name]
+
+    acro_form.makeFont = shared_make_font
+
+def _quiet(*args, **kwargs):
+    """Stand-in for print when status output is switched off"""
+
 class BackgroundGenerator:
     """Generate seasonal background illustrations"""
 
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.log = print if verbose else _quiet
         self.use_images = self.check_image_files()
         if self.use_images:
-            print("✓ Using external image files for backgrounds")
+            self.log("✓ Using external image files for backgrounds")
         else:
-            print("! External images not found, using generated backgrounds")
+            self.log("! External images not found, using generated backgrounds")
+        # Each season's image is opened once, on first use, and the reader
+        # is reused for every later page of that season
+        self._image_readers = {}
+
+        # Gradient sky colors, one per 8pt stripe from the top of the page
+        self._sky = {
+            season: [Color(r + i / 50.0 * dr, g + i / 50.0 * dg, b + i / 50.0 * db, alpha=0.1)
+                     for i in range(50)]
+            for season, ((r, g, b), (dr, dg, db)) in SKY_GRADIENTS.items()
+        }
+
+        # Polar offsets: five petals 6pt around each flower, and eight sun
+        # rays running from 45pt to 65pt out from the center of the sun
+        petal_angles = [i * 2 * math.pi / 5 for i in range(5)]
+        self._petal_offsets = [(6 * math.cos(a), 6 * math.sin(a)) for a in petal_angles]
+        ray_angles = [i * 2 * math.pi / 8 for i in range(8)]
+        self._sun_rays = [(45 * math.cos(a), 45 * math.sin(a), 65 * math.cos(a), 65 * math.sin(a))
+                          for a in ray_angles]
+
+        # Decoration positions are sampled once and reused on every page of
+        # a season; coordinates are stored as fractions of the page size.
+        # A fixed seed keeps the artwork identical between runs.
+        rng = random.Random(42)
+        self._season_particles = {
+            'winter': {
+                'snow': [(rng.uniform(0, 1), rng.uniform(0.3, 0.9))
+                         for _ in range(20)],
+            },
+            'spring': {
+                'blossoms': [[(rng.uniform(-35, 35), rng.uniform(-35, 35))
+                              for _ in range(8)] for _ in range(4)],
+                'flowers': [(rng.uniform(0, 1), rng.uniform(0.1, 0.25))
+                            for _ in range(15)],
+            },
+            'summer': {
+                'grass': [(rng.uniform(0, 1), rng.uniform(0.1, 0.25))
+                          for _ in range(30)],
+            },
+            'autumn': {
+                'leaves': [(rng.uniform(0, 1), rng.uniform(0.3, 0.8), rng.randrange(3))
+                           for _ in range(25)],
+            },
+        }
 
     def check_image_files(self):
         """Check if all seasonal background images exist"""
         return all(os.path.exists(path) for path in SEASON_BACKGROUNDS.values())
 
-    def draw_background_image(self, c, image_path, width, height):
-        """Draw an external image file as background"""
+    def draw_background_image(self, c, season, width, height):
+        """Draw a season's external image file as background"""
         try:
-            # Draw image with low opacity for subtle background effect
-            c.saveState()
-            c.setFillColorRGB(1, 1, 1, alpha=0.7)  # White overlay for transparency effect
-            c.drawImage(image_path, 0, 0, width=width, height=height,
+            reader = self._image_readers.get(season)
+            if reader is None:
+                reader = self._image_readers[season] = ImageReader(SEASON_BACKGROUNDS[season])
+            c.drawImage(reader, 0, 0, width=width, height=height,
                        preserveAspectRatio=True, mask='auto')
-            c.restoreState()
         except Exception as e:
-            print(f"Warning: Could not load image {image_path}: {e}")
+            print(f"Warning: Could not load image {SEASON_BACKGROUNDS[season]}: {e}")
             # Fallback to generated background
             self.use_images = False
             return False
@@ -214,23 +302,31 @@ class BackgroundGenerator:
 
     def get_season_from_month(self, month):
         """Get season string from month number"""
-        if month in [12, 1, 2]:
-            return 'winter'
-        elif month in [3, 4, 5]:
-            return 'spring'
-        elif month in [6, 7, 8]:
-            return 'summer'
-        else:
-            return 'autumn'
+        return SeasonalTheme.get_season(month)
 
-    def draw_seasonal_background(self, c, width, height, month):
-        """Draw seasonal background - either from image file or generated"""
+    def create_background_form(self, c, width, height, season):
+        """Render a season's background once as a reusable form XObject"""
+        c.beginForm(f"bg_{season}")
+        self.render_season_background(c, width, height, season)
+        _end_form(c)
+
+    def background_form(self, c, width, height, month):
+        """Name of the background form for a month, rendering it on first use"""
         season = self.get_season_from_month(month)
+        form_name = f"bg_{season}"
+        if not c.hasForm(form_name):
+            self.create_background_form(c, width, height, season)
+        return form_name
+
+    def draw_seasonal_background(self, c, width, height, month):
+        """Draw seasonal background from its season's form"""
+        c.doForm(self.background_form(c, width, height, month))
 
+    def render_season_background(self, c, width, height, season):
+        """Draw seasonal background - either from image file or generated"""
         if self.use_images:
             # Try to use external image file
-            image_path = SEASON_BACKGROUNDS[season]
-            if self.draw_background_image(c, image_path, width, height):
+            if self.draw_background_image(c, season, width, height):
                 return
             # If image loading fails, fall back to generated backgrounds
 
@@ -244,159 +340,148 @@ class BackgroundGenerator:
         else:  # autumn
             self.draw_autumn_background(c, width, height)
 
-    @staticmethod
-    def draw_winter_background(c, width, height):
-        """Draw winter themed background with snow and trees"""
-        # Gradient sky
-        for i in range(50):
-            alpha = i / 50.0
-            sky_color = Color(0.7 + alpha * 0.2, 0.8 + alpha * 0.15, 0.9 + alpha * 0.1, alpha=0.1)
+    def draw_sky(self, c, width, height, season):
+        """Draw the precomputed gradient sky for a season"""
+        for i, sky_color in enumerate(self._sky[season]):
             c.setFillColor(sky_color)
             c.rect(0, height - i * 8, width, 8, fill=1, stroke=0)
 
+    def draw_winter_background(self, c, width, height):
+        """Draw winter themed background with snow and trees"""
+        # Gradient sky
+        self.draw_sky(c, width, height, 'winter')
+
         # Snow-covered ground
-        c.setFillColor(Color(0.95, 0.97, 1.0, alpha=0.3))
+        c.setFillColor(_rgba(0.95, 0.97, 1.0, 0.3))
         c.rect(0, 0, width, height * 0.2, fill=1, stroke=0)
 
         # Simple evergreen trees
         tree_positions = [100, 200, width-150, width-50]
         for x in tree_positions:
             # Tree trunk
-            c.setFillColor(Color(0.3, 0.2, 0.1, alpha=0.2))
+            c.setFillColor(_rgba(0.3, 0.2, 0.1, 0.2))
             c.rect(x-5, height*0.1, 10, height*0.15, fill=1, stroke=0)
 
             # Tree layers
+            c.setFillColor(_rgba(0.1, 0.3, 0.1, 0.15))
             for layer in range(3):
                 y_offset = height * (0.2 + layer * 0.08)
                 tree_width = 30 - layer * 5
-                c.setFillColor(Color(0.1, 0.3, 0.1, alpha=0.15))
                 # Simple triangle for tree layer
-                c.beginPath()
-                c.moveTo(x, y_offset)
-                c.lineTo(x - tree_width//2, y_offset - 30)
-                c.lineTo(x + tree_width//2, y_offset - 30)
-                c.closePath()
-                c.drawPath(fill=1, stroke=0)
+                p = c.beginPath()
+                p.moveTo(x, y_offset)
+                p.lineTo(x - tree_width//2, y_offset - 30)
+                p.lineTo(x + tree_width//2, y_offset - 30)
+                p.close()
+                c.drawPath(p, fill=1, stroke=0)
 
         # Falling snowflakes
-        for i in range(20):
-            snow_x = random.uniform(0, width)
-            snow_y = random.uniform(height*0.3, height*0.9)
-            c.setFillColor(Color(1, 1, 1, alpha=0.4))
+        c.setFillColor(SNOW_WHITE)
+        for snow_fx, snow_fy in self._season_particles['winter']['snow']:
+            snow_x = snow_fx * width
+            snow_y = snow_fy * height
             c.circle(snow_x, snow_y, 2, fill=1, stroke=0)
 
-    @staticmethod
-    def draw_spring_background(c, width, height):
+    def draw_spring_background(self, c, width, height):
         """Draw spring themed background with flowers and new growth"""
         # Gradient sky
-        for i in range(50):
-            alpha = i / 50.0
-            sky_color = Color(0.8 + alpha * 0.1, 0.9 + alpha * 0.05, 0.8 + alpha * 0.1, alpha=0.1)
-            c.setFillColor(sky_color)
-            c.rect(0, height - i * 8, width, 8, fill=1, stroke=0)
+        self.draw_sky(c, width, height, 'spring')
 
         # Green meadow
-        c.setFillColor(Color(0.7, 0.9, 0.7, alpha=0.3))
+        c.setFillColor(_rgba(0.7, 0.9, 0.7, 0.3))
         c.rect(0, 0, width, height * 0.25, fill=1, stroke=0)
 
         # Blooming trees
         tree_positions = [80, 180, width-120, width-40]
-        for x in tree_positions:
+        particles = self._season_particles['spring']
+        for x, blossoms in zip(tree_positions, particles['blossoms']):
             # Tree trunk
-            c.setFillColor(Color(0.4, 0.3, 0.2, alpha=0.2))
+            c.setFillColor(_rgba(0.4, 0.3, 0.2, 0.2))
             c.rect(x-8, height*0.15, 16, height*0.2, fill=1, stroke=0)
 
             # Blooming canopy
-            c.setFillColor(Color(0.9, 0.95, 0.9, alpha=0.2))
+            c.setFillColor(_rgba(0.9, 0.95, 0.9, 0.2))
             c.circle(x, height*0.4, 40, fill=1, stroke=0)
 
             # Pink blossoms
-            for j in range(8):
-                blossom_x = x + random.uniform(-35, 35)
-                blossom_y = height*0.4 + random.uniform(-35, 35)
-                c.setFillColor(Color(1.0, 0.8, 0.9, alpha=0.3))
+            c.setFillColor(_rgba(1.0, 0.8, 0.9, 0.3))
+            for blossom_dx, blossom_dy in blossoms:
+                blossom_x = x + blossom_dx
+                blossom_y = height*0.4 + blossom_dy
                 c.circle(blossom_x, blossom_y, 3, fill=1, stroke=0)
 
         # Scattered flowers
-        for i in range(15):
-            flower_x = random.uniform(50, width-50)
-            flower_y = random.uniform(height*0.1, height*0.25)
+        for flower_fx, flower_fy in particles['flowers']:
+            flower_x = 50 + flower_fx * (width - 100)
+            flower_y = flower_fy * height
             # Simple flower
-            c.setFillColor(Color(1.0, 0.9, 0.3, alpha=0.4))
+            c.setFillColor(_rgba(1.0, 0.9, 0.3, 0.4))
             c.circle(flower_x, flower_y, 4, fill=1, stroke=0)
-            c.setFillColor(Color(0.9, 0.3, 0.5, alpha=0.3))
-            for petal in range(5):
-                angle = petal * 72 * 3.14159 / 180
-                petal_x = flower_x + 6 * (angle / 3.14159)
-                petal_y = flower_y + 6 * (1 - angle / 3.14159)
-                c.circle(petal_x, petal_y, 2, fill=1, stroke=0)
+            c.setFillColor(_rgba(0.9, 0.3, 0.5, 0.3))
+            for petal_dx, petal_dy in self._petal_offsets:
+                c.circle(flower_x + petal_dx, flower_y + petal_dy, 2, fill=1, stroke=0)
 
-    @staticmethod
-    def draw_summer_background(c, width, height):
+    def draw_summer_background(self, c, width, height):
         """Draw summer themed background with sun and lush landscape"""
         # Gradient sky
-        for i in range(50):
-            alpha = i / 50.0
-            sky_color = Color(0.9, 0.85 + alpha * 0.1, 0.7 + alpha * 0.2, alpha=0.1)
-            c.setFillColor(sky_color)
-            c.rect(0, height - i * 8, width, 8, fill=1, stroke=0)
+        self.draw_sky(c, width, height, 'summer')
 
         # Sun
-        c.setFillColor(Color(1.0, 0.9, 0.3, alpha=0.3))
+        c.setFillColor(_rgba(1.0, 0.9, 0.3, 0.3))
         c.circle(width*0.8, height*0.8, 35, fill=1, stroke=0)
 
         # Sun rays
-        c.setStrokeColor(Color(1.0, 0.9, 0.3, alpha=0.2))
+        c.setStrokeColor(_rgba(1.0, 0.9, 0.3, 0.2))
         c.setLineWidth(3)
-        for angle in range(0, 360, 45):
-            rad = angle * 3.14159 / 180
-            x1 = width*0.8 + 45 * (angle / 180)
-            y1 = height*0.8 + 45 * (1 - angle / 180)
-            x2 = width*0.8 + 65 * (angle / 180)
-            y2 = height*0.8 + 65 * (1 - angle / 180)
-            c.line(x1, y1, x2, y2)
-
-        # Rolling hills
-        c.setFillColor(Color(0.6, 0.8, 0.4, alpha=0.3))
-        # Simple hill curve using multiple rectangles
-        for i in range(0, int(width), 20):
-            hill_height = height * 0.3 + 30 * abs((i - width/2) / (width/4))
-            c.rect(i, 0, 20, hill_height, fill=1, stroke=0)
+        sun_x, sun_y = width*0.8, height*0.8
+        p = c.beginPath()
+        for dx1, dy1, dx2, dy2 in self._sun_rays:
+            p.moveTo(sun_x + dx1, sun_y + dy1)
+            p.lineTo(sun_x + dx2, sun_y + dy2)
+        c.drawPath(p, stroke=1, fill=0)
+
+        # Rolling hills, traced as one filled outline
+        c.setFillColor(_rgba(0.6, 0.8, 0.4, 0.3))
+        p = c.beginPath()
+        p.moveTo(0, 0)
+        for x, y in _hill_points(width, height):
+            p.lineTo(x, y)
+        p.lineTo(width, 0)
+        p.close()
+        c.drawPath(p, fill=1, stroke=0)
 
         # Tall summer grass
-        c.setStrokeColor(Color(0.4, 0.7, 0.3, alpha=0.4))
+        c.setStrokeColor(_rgba(0.4, 0.7, 0.3, 0.4))
         c.setLineWidth(2)
-        for i in range(30):
-            grass_x = random.uniform(0, width)
-            grass_height = random.uniform(height*0.1, height*0.25)
-            c.line(grass_x, height*0.05, grass_x, grass_height)
-
-    @staticmethod
-    def draw_autumn_background(c, width, height):
+        p = c.beginPath()
+        for grass_fx, grass_fh in self._season_particles['summer']['grass']:
+            grass_x = grass_fx * width
+            grass_height = grass_fh * height
+            p.moveTo(grass_x, height*0.05)
+            p.lineTo(grass_x, grass_height)
+        c.drawPath(p, stroke=1, fill=0)
+
+    def draw_autumn_background(self, c, width, height):
         """Draw autumn themed background with falling leaves"""
         # Gradient sky
-        for i in range(50):
-            alpha = i / 50.0
-            sky_color = Color(0.9, 0.8 + alpha * 0.1, 0.7 + alpha * 0.1, alpha=0.1)
-            c.setFillColor(sky_color)
-            c.rect(0, height - i * 8, width, 8, fill=1, stroke=0)
+        self.draw_sky(c, width, height, 'autumn')
 
         # Ground with fallen leaves
-        c.setFillColor(Color(0.8, 0.7, 0.5, alpha=0.3))
+        c.setFillColor(_rgba(0.8, 0.7, 0.5, 0.3))
         c.rect(0, 0, width, height * 0.2, fill=1, stroke=0)
 
         # Deciduous trees with autumn colors
         tree_positions = [90, 170, width-130, width-60]
         autumn_colors = [
-            Color(0.9, 0.6, 0.2, alpha=0.3),  # Orange
-            Color(0.9, 0.8, 0.3, alpha=0.3),  # Yellow
-            Color(0.8, 0.3, 0.2, alpha=0.3),  # Red
-            Color(0.7, 0.5, 0.2, alpha=0.3)   # Brown
+            _rgba(0.9, 0.6, 0.2, 0.3),  # Orange
+            _rgba(0.9, 0.8, 0.3, 0.3),  # Yellow
+            _rgba(0.8, 0.3, 0.2, 0.3),  # Red
+            _rgba(0.7, 0.5, 0.2, 0.3)   # Brown
         ]
 
         for i, x in enumerate(tree_positions):
             # Tree trunk
-            c.setFillColor(Color(0.4, 0.3, 0.2, alpha=0.3))
+            c.setFillColor(_rgba(0.4, 0.3, 0.2, 0.3))
             c.rect(x-8, height*0.12, 16, height*0.25, fill=1, stroke=0)
 
             # Autumn canopy
@@ -406,47 +491,74 @@ class BackgroundGenerator:
 
         # Falling autumn leaves
         leaf_colors = [
-            Color(0.9, 0.6, 0.2, alpha=0.5),  # Orange
-            Color(0.9, 0.8, 0.3, alpha=0.5),  # Yellow
-            Color(0.8, 0.3, 0.2, alpha=0.5),  # Red
+            _rgba(0.9, 0.6, 0.2, 0.5),  # Orange
+            _rgba(0.9, 0.8, 0.3, 0.5),  # Yellow
+            _rgba(0.8, 0.3, 0.2, 0.5),  # Red
         ]
 
-        for i in range(25):
-            leaf_x = random.uniform(0, width)
-            leaf_y = random.uniform(height*0.3, height*0.8)
-            leaf_color = random.choice(leaf_colors)
+        for leaf_fx, leaf_fy, color_index in self._season_particles['autumn']['leaves']:
+            leaf_x = leaf_fx * width
+            leaf_y = leaf_fy * height
+            leaf_color = leaf_colors[color_index]
             c.setFillColor(leaf_color)
             # Simple leaf shape (oval)
             c.ellipse(leaf_x-3, leaf_y-2, leaf_x+3, leaf_y+2, fill=1, stroke=0)
 
+# Calendar cell styling for holidays and weekends
+HOLIDAY_CELL_COLOR = Color(1.0, 0.8, 0.8)    # Light red for holidays
+WEEKEND_CELL_COLOR = Color(0.9, 0.9, 1.0)    # Light blue for weekends
+HOLIDAY_LABEL_COLOR = Color(0.6, 0.0, 0.0)
+WEEKEND_LABEL_COLOR = Color(0.0, 0.0, 0.6)
+
+# Day page form fields are see-through (with alpha 0 the RGB is irrelevant);
+# the fallback boxes use grey placeholder text
+_TRANSPARENT_FILL = Color(0, 0, 0, 0.0)
+_PLACEHOLDER_GREY = Color(0.6, 0.6, 0.6)
+DAY_NUMBER_FONT = ("DancingScript-Bold", 21)
+HOLIDAY_LABEL_FONT = ("DancingScript-Regular", 7)
+WEEKEND_LABEL_FONT = ("DancingScript-Regular", 8)
+
+# Day page sections: (field kind, heading, placeholder, placeholder font)
+DAY_SECTIONS = (
+    ("activities", "Activities:", "Write your activities here...", "DancingScript-Bold"),
+    ("notes", "Notes:", "Write your notes here...", "DancingScript-Regular"),
+)
+
 class DiaryGenerator:
-    def __init__(self, year,enc):
+    def __init__(self, year,enc, verbose=False):
         self.year = year
         self.enc = enc
+        # Progress and summary messages are only printed in verbose mode
+        self.log = print if verbose else _quiet
         self.width, self.height = A4
-        self.quotes_used = set()
+        # Endless stream of quotes: each pass is a fresh shuffle of the full
+        # list, so no quote repeats until all of them have been used
+        self._quotes = itertools.chain.from_iterable(
+            random.sample(WISDOM_QUOTES, len(WISDOM_QUOTES)) for _ in itertools.count())
         self.holidays = get_us_holidays(year)
-        self.background_gen = BackgroundGenerator()
+        # Holiday names keyed by (month, day) for the per-day lookups
+        self._holiday_names = {(d.month, d.day): name for d, name in self.holidays.items()}
+        self.background_gen = BackgroundGenerator(verbose)
         self.personal_info_manager = PersonalInfoManager(self)
+        self._build_month_tabs()
+        # Month names and calendar grids, shared by the month and day pages
+        self._month_names = list(calendar.month_name)
+        self._month_calendars = {m: calendar.monthcalendar(year, m) for m in range(1, 13)}
+        self._build_month_cells()
+        self._build_day_meta()
+        self._build_day_layouts()
+        self._build_day_field_styles()
 
     def get_unique_quote(self):
         """Get a unique wisdom quote"""
-        available_quotes = [q for q in WISDOM_QUOTES if q not in self.quotes_used]
-        if not available_quotes:
-            # Reset if we've used all quotes
-            self.quotes_used.clear()
-            available_quotes = WISDOM_QUOTES
-
-        quote = random.choice(available_quotes)
-        self.quotes_used.add(quote)
-        return quote
+        return next(self._quotes)
 
     def draw_seasonal_background(self, c, month_num):
         """Draw seasonal background based on month"""
         self.background_gen.draw_seasonal_background(c, self.width, self.height, month_num)
 
-    def draw_month_tabs(self, c, current_month=None):
-        """Draw month tabs on the right side of the page"""
+    def _build_month_tabs(self):
+        """Precompute month tab positions, colors and centered labels"""
         tab_width = 83
         tab_height = 65
         start_x = self.width - tab_width - 10
@@ -455,34 +567,86 @@ class DiaryGenerator:
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
+        self._tab_rect = (start_x, tab_width, tab_height)
+        tabs = []
         for i, month in enumerate(months):
             y = start_y - (i * (tab_height + 2))
 
             # Determine colors based on season
-            season = SeasonalTheme.get_season(i + 1)
-            colors = SeasonalTheme.get_colors(season)
+            colors = SeasonalTheme.get_colors(SeasonalTheme.get_season(i + 1))
+
+            # Center the label at the size it is drawn with
+            text_width = pdfmetrics.stringWidth(month, "DancingScript-Bold", 30)
+            text_x = start_x + (tab_width - text_width) / 2
+            tabs.append((i + 1, y, colors, month, text_x))
+
+        # One ready-made tab list per current month (None for pages outside
+        # the months), with the highlight colour and link already resolved:
+        # (y, tab fill, text color, label, text x, link name or None)
+        self._tab_layouts = {
+            current_month: tuple(
+                (y,
+                 colors["accent"] if month_num == current_month else colors["primary"],
+                 colors["text"], month, text_x,
+                 # Don't link to current page
+                 None if month_num == current_month else f"month_{month_num}")
+                for month_num, y, colors, month, text_x in tabs)
+            for current_month in [None, *range(1, 13)]
+        }
 
-            # Highlight current month
-            if current_month == i + 1:
-                c.setFillColor(colors["accent"])
-            else:
-                c.setFillColor(colors["primary"])
+    def _draw_tab_shapes(self, c, current_month):
+        """Draw the month tab boxes and labels, highlighting the current month"""
+        start_x, tab_width, tab_height = self._tab_rect
 
-            # Draw tab
+        c.setFont("DancingScript-Bold", 30)
+        for y, tab_fill, text_color, month, text_x, link in self._tab_layouts[current_month]:
+            # Draw tab, highlighted for the current month
+            c.setFillColor(tab_fill)
             c.rect(start_x, y, tab_width, tab_height, fill=1, stroke=1)
 
             # Add month text
-            c.setFillColor(colors["text"])
-            c.setFont("DancingScript-Bold", 30)
-            text_width = c.stringWidth(month, "DancingScript-Bold", 15)
-            c.drawString(start_x + (tab_width - text_width) / 2, y + 8, month)
+            c.setFillColor(text_color)
+            c.drawString(text_x, y + 8, month)
+
+    def _draw_tab_links(self, c, current_month):
+        """Add link annotations for navigation to the month views"""
+        start_x, tab_width, tab_height = self._tab_rect
 
-            # Add link annotation for navigation (to month view)
-            if current_month != i + 1:  # Don't link to current page
+        for y, tab_fill, text_color, month, text_x, link in self._tab_layouts[current_month]:
+            if link is not None:  # Don't link to current page
                 # Create internal document link
-                c.linkRect("", f"month_{i+1}", (start_x, y, start_x + tab_width, y + tab_height))
-                if hasattr(self, 'personal_info_manager'):
-                    self.personal_info_manager.draw_personal_info_tab(c)
+                c.linkRect("", link, (start_x, y, start_x + tab_width, y + tab_height))
+
+    def draw_month_tabs(self, c, current_month=None):
+        """Draw month tabs on the right side of the page"""
+        self._draw_tab_shapes(c, current_month)
+        self._draw_tab_links(c, current_month)
+
+        if hasattr(self, 'personal_info_manager'):
+            self.personal_info_manager.draw_personal_info_tab(c)
+
+    def draw_page_chrome(self, c, month_num, bookmark):
+        """
+        Draw what every month and day page of a month shares, and bookmark the page
+
+        The season background and the month tabs are identical on all pages
+        of a month, so they are drawn once into a form XObject per month and
+        replayed. Link annotations belong to the page and are added each time.
+        """
+        form_name = f"chrome_{month_num}"
+        if not c.hasForm(form_name):
+            background = self.background_gen.background_form(c, self.width, self.height, month_num)
+            c.beginForm(form_name)
+            c.doForm(background)
+            self._draw_tab_shapes(c, month_num)
+            _end_form(c)
+        c.doForm(form_name)
+
+        self._draw_tab_links(c, month_num)
+        if hasattr(self, 'personal_info_manager'):
+            self.personal_info_manager.draw_personal_info_tab(c)
+
+        c.bookmarkPage(bookmark)
 
     def create_cover_page(self, c):
         """Create the cover page"""
@@ -518,62 +682,228 @@ class DiaryGenerator:
 
         # Bottom quote
         quote = self.get_unique_quote()
-        c.setFont("DancingScript-Bold", 12)
         c.setFillColor(Color(0.3, 0.4, 0.6))
-        quote_lines = self.wrap_text(quote, 400, "DancingScript-Regular", 12)
-        y_pos = 100
-        for line in quote_lines:
-            line_width = c.stringWidth(line, "DancingScript-Regular", 12)
-            c.drawString((self.width - line_width) / 2, y_pos, line)
-            y_pos -= 15
+        self.draw_quote(c, quote, "DancingScript-Bold", 12, 100, 15)
 
         c.showPage()
 
     def wrap_text(self, text, max_width, font_name, font_size):
         """Wrap text to fit within specified width"""
-        words = text.split()
-        lines = []
-        current_line = []
+        return _wrap_text(text, max_width, font_name, font_size)
+
+    def draw_quote(self, c, quote, font_name, font_size, top_y, leading):
+        """Draw a quote wrapped to 400pt and centered, one line per leading step down from top_y"""
+        c.setFont(font_name, font_size)
+        for x, y, line in _quote_geometry(quote, font_name, font_size, self.width, top_y, leading):
+            c.drawString(x, y, line)
+
+    def _build_month_cells(self):
+        """
+        Lay out every month's calendar cells once for the whole year
+
+        Each cell is (x, y, day string, kind, label, link name), where kind
+        is 0 for a plain day, 1 for a weekend and 2 for a holiday, and label
+        is the abbreviated holiday name or weekend day (None otherwise).
+        """
+        start_x = 50
+        start_y = self.height - 180
+        cell_width = (self.width - 160) / 7
+        cell_height = 70
 
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if len(test_line) * font_size * 0.6 <= max_width:  # Rough approximation
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
+        self._month_cells = {}
+        for month_num, cal in self._month_calendars.items():
+            cells = []
+            for week_num, week in enumerate(cal):
+                y = start_y - (week_num + 1) * cell_height
+
+                for day_num, day in enumerate(week):
+                    if day == 0:
+                        continue
+
+                    # The grid columns run Monday..Sunday, so the column is the weekday
+                    holiday_name = self._holiday_names.get((month_num, day))
+                    if holiday_name is not None:
+                        # Abbreviate long holiday names
+                        if len(holiday_name) > 15:
+                            holiday_name = holiday_name[:12] + "..."
+                        kind, label = 2, holiday_name
+                    elif day_num >= 5:
+                        kind, label = 1, "Sat" if day_num == 5 else "Sun"
+                    else:
+                        kind, label = 0, None
+
+                    cells.append((start_x + day_num * cell_width, y, str(day),
+                                  kind, label, f"day_{month_num}_{day}"))
+            self._month_cells[month_num] = tuple(cells)
+
+    def _build_day_meta(self):
+        """
+        Precompute the per-day details used by the day pages
+
+        Maps (month, day) to (day name, month name, is holiday, is weekend,
+        holiday text), with the weekday taken from the month grid column.
+        """
+        day_names = list(calendar.day_name)
+        self._day_meta = {}
+        for month_num, cal in self._month_calendars.items():
+            month_name = self._month_names[month_num]
+            for week in cal:
+                for weekday, day in enumerate(week):
+                    if day == 0:
+                        continue
+                    holiday_name = self._holiday_names.get((month_num, day))
+                    holiday_text = f"🎉 {holiday_name} 🎉" if holiday_name is not None else None
+                    self._day_meta[(month_num, day)] = (
+                        day_names[weekday], month_name,
+                        holiday_name is not None, weekday >= 5, holiday_text)
+
+    def _build_day_layouts(self):
+        """
+        Precompute the day page geometry
+
+        The layout only depends on whether the page carries a holiday or
+        weekend banner, which pushes the sections 20pt down, so there are
+        two variants keyed by that flag.
+        """
+        box_w, box_h = self.width - 150, 150
+        line_spacing = 15
+        line_offsets = [box_h - i * line_spacing for i in range(1, int(box_h / line_spacing))]
+
+        self._day_layouts = {}
+        for has_banner in (False, True):
+            y_offset = -140 if has_banner else -120
+            notes_y_offset = y_offset - 240
+            activities_y = self.height + y_offset - 160
+            notes_y = self.height + notes_y_offset - 160
+            self._day_layouts[has_banner] = {
+                "activities_label": (50, self.height + y_offset),
+                "activities_rect": (50, activities_y, box_w, box_h),
+                "activities_line_ys": [activities_y + off for off in line_offsets],
+                "notes_label": (50, self.height + notes_y_offset),
+                "notes_rect": (50, notes_y, box_w, box_h),
+                "notes_line_ys": [notes_y + off for off in line_offsets],
+            }
+
+    def _build_day_field_styles(self):
+        """
+        Build the form field keyword arguments shared by every day page of a season
+
+        All activities and notes fields in a season are styled the same, so
+        the keyword dicts are built once here rather than on every page.
+        """
+        self._day_field_styles = {}
+        for season in SEASON_BACKGROUNDS:
+            colors = SeasonalTheme.get_colors(season)
+            shared = dict(
+                borderStyle='inset',
+                forceBorder=True,
+                fontName='Helvetica',
+                textColor=colors["text"],
+#                fillColor=colors["primary"],
+                fillColor=_TRANSPARENT_FILL,
+                borderWidth=1,
+                fieldFlags='multiline',
+            )
+            self._day_field_styles[season] = {
+                "activities": dict(shared, tooltip='Enter your activities for this day', fontSize=10),
+                "notes": dict(shared, tooltip='Enter your notes for this day', fontSize=20),
+            }
 
-        if current_line:
-            lines.append(' '.join(current_line))
+    @staticmethod
+    def _draw_day_section(c, use_acroform, layout, kind, heading, field_name, field_style,
+                          placeholder, placeholder_font, colors):
+        """Draw one titled day page section: a form field, or a ruled box without AcroForm"""
+        label_x, label_y = layout[f"{kind}_label"]
+        c.setFont("DancingScript-Bold", 25)
+        c.setFillColor(colors["text"])
+        c.drawString(label_x, label_y, heading)
+
+        x, y, w, h = layout[f"{kind}_rect"]
+
+        if use_acroform:
+            # Create an interactive form field
+            c.acroForm.textfield(name=field_name, x=x, y=y, width=w, height=h, **field_style)
+            return
+
+        # Fallback: Draw visual text area if acroForm not available
+        c.setFillColor(colors["primary"])
+        c.setStrokeColor(colors["accent"])
+        c.setLineWidth(1)
+        c.rect(x, y, w, h, fill=1, stroke=1)
+
+        # Add lines for writing
+        c.setLineWidth(0.5)
+        line_x1, line_x2 = x + 10, x + w - 10
+        p = c.beginPath()
+        for line_y in layout[f"{kind}_line_ys"]:
+            p.moveTo(line_x1, line_y)
+            p.lineTo(line_x2, line_y)
+        c.drawPath(p, stroke=1, fill=0)
+
+        # Add placeholder text
+        c.setFillColor(_PLACEHOLDER_GREY)
+        c.setFont(placeholder_font, 10)
+        c.drawString(x + 15, y + h - 15, placeholder)
 
-        return lines
+    @staticmethod
+    def _draw_calendar_cells(c, cells, cell_width, cell_height, colors):
+        """Draw prepared calendar cells, only changing font/fill when needed"""
+        text_color = colors["text"]
+        cell_colors = (colors["primary"], WEEKEND_CELL_COLOR, HOLIDAY_CELL_COLOR)
+        label_styles = (None, (WEEKEND_LABEL_FONT, WEEKEND_LABEL_COLOR),
+                        (HOLIDAY_LABEL_FONT, HOLIDAY_LABEL_COLOR))
+        last_font = None
+        last_fill = None
+
+        for x, y, day_str, kind, label, link in cells:
+            # Choose cell color based on day type
+            cell_fill = cell_colors[kind]
+            if cell_fill is not last_fill:
+                c.setFillColor(cell_fill)
+                last_fill = cell_fill
+
+            # Draw cell
+            c.rect(x, y, cell_width, cell_height, fill=1, stroke=1)
+
+            # Draw day number
+            if text_color is not last_fill:
+                c.setFillColor(text_color)
+                last_fill = text_color
+            if last_font != DAY_NUMBER_FONT:
+                c.setFont(*DAY_NUMBER_FONT)
+                last_font = DAY_NUMBER_FONT
+            c.drawString(x + 5, y + cell_height - 20, day_str)
+
+            # Holiday name or weekend day label
+            if label is not None:
+                font, fill = label_styles[kind]
+                if last_font != font:
+                    c.setFont(*font)
+                    last_font = font
+                if last_fill is not fill:
+                    c.setFillColor(fill)
+                    last_fill = fill
+                c.drawString(x + 2, y + 5, label)
+
+            # Add link to day page
+            c.linkRect("", link, (x, y, x + cell_width, y + cell_height))
 
     def create_month_page(self, c, month_num):
         """Create a month view page"""
         season = SeasonalTheme.get_season(month_num)
         colors = SeasonalTheme.get_colors(season)
 
-        # Draw seasonal background first
-        self.draw_seasonal_background(c, month_num)
-
-        # Draw month tabs
-        self.draw_month_tabs(c, month_num)
-
-        # Add bookmark for this month
-        c.bookmarkPage(f"month_{month_num}")
+        # Seasonal background, month tabs and the bookmark for this month
+        self.draw_page_chrome(c, month_num, f"month_{month_num}")
 
         # Month title
-        month_name = calendar.month_name[month_num]
+        month_name = self._month_names[month_num]
         c.setFillColor(colors["text"])
         c.setFont("DancingScript-Bold", 38)
         title = f"{month_name} {self.year}"
         title_width = c.stringWidth(title, "DancingScript-Bold", 38)
         c.drawString((self.width - title_width) / 2, self.height - 80, title)
 
-        # Calendar grid
-        cal = calendar.monthcalendar(self.year, month_num)
-
         # Days of week header
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         start_x = 50
@@ -593,66 +923,12 @@ class DiaryGenerator:
             c.drawString(x - day_width / 2, start_y + 15, day)
 
         # Draw calendar days
-        for week_num, week in enumerate(cal):
-            y = start_y - (week_num + 1) * cell_height
-
-            for day_num, day in enumerate(week):
-                x = start_x + day_num * cell_width
-
-                if day == 0:
-                    continue
-
-                # Check if this day is a holiday or weekend
-                current_date = date(self.year, month_num, day)
-                is_holiday = current_date in self.holidays
-                is_wknd = is_weekend(current_date)
-
-                # Choose cell color based on day type
-                if is_holiday:
-                    c.setFillColor(Color(1.0, 0.8, 0.8))  # Light red for holidays
-                elif is_wknd:
-                    c.setFillColor(Color(0.9, 0.9, 1.0))  # Light blue for weekends
-                else:
-                    c.setFillColor(colors["primary"])
-
-                # Draw cell
-                c.rect(x, y, cell_width, cell_height, fill=1, stroke=1)
-
-                # Draw day number
-                c.setFillColor(colors["text"])
-                c.setFont("DancingScript-Bold", 21)
-                day_str = str(day)
-                day_width = c.stringWidth(day_str, "DancingScript-Bold", 11)
-                c.drawString(x + 5, y + cell_height - 20, day_str)
-
-                # Add holiday name if applicable (abbreviated)
-                if is_holiday:
-                    holiday_name = self.holidays[current_date]
-                    # Abbreviate long holiday names
-                    if len(holiday_name) > 15:
-                        holiday_name = holiday_name[:12] + "..."
-                    c.setFont("DancingScript-Regular", 7)
-                    c.setFillColor(Color(0.6, 0.0, 0.0))
-                    c.drawString(x + 2, y + 5, holiday_name)
-                elif is_wknd:
-                    c.setFont("DancingScript-Regular", 8)
-                    c.setFillColor(Color(0.0, 0.0, 0.6))
-                    weekend_label = "Sat" if current_date.weekday() == 5 else "Sun"
-                    c.drawString(x + 2, y + 5, weekend_label)
-
-                # Add link to day page
-                c.linkRect("", f"day_{month_num}_{day}", (x, y, x + cell_width, y + cell_height))
+        self._draw_calendar_cells(c, self._month_cells[month_num], cell_width, cell_height, colors)
 
         # Add wisdom quote at bottom
         quote = self.get_unique_quote()
-        c.setFont("DancingScript-Regular", 10)
         c.setFillColor(colors["text"])
-        quote_lines = self.wrap_text(quote, 400, "DancingScript-Regular", 10)
-        y_pos = 80
-        for line in quote_lines:
-            line_width = c.stringWidth(line, "DancingScript-Regular", 10)
-            c.drawString((self.width - line_width) / 2, y_pos, line)
-            y_pos -= 12
+        self.draw_quote(c, quote, "DancingScript-Regular", 10, 80, 12)
 
         c.showPage()
 
@@ -661,23 +937,11 @@ class DiaryGenerator:
         season = SeasonalTheme.get_season(month_num)
         colors = SeasonalTheme.get_colors(season)
 
-        # Draw seasonal background first
-        self.draw_seasonal_background(c, month_num)
-
-        # Draw month tabs
-        self.draw_month_tabs(c, month_num)
-
-        # Add bookmark for this day
-        c.bookmarkPage(f"day_{month_num}_{day_num}")
+        # Seasonal background, month tabs and the bookmark for this day
+        self.draw_page_chrome(c, month_num, f"day_{month_num}_{day_num}")
 
-        # Date and day of week
-        date_obj = date(self.year, month_num, day_num)
-        day_name = date_obj.strftime("%A")
-        month_name = calendar.month_name[month_num]
-
-        # Check if this day is special
-        is_holiday = date_obj in self.holidays
-        is_wknd = is_weekend(date_obj)
+        # Date, day of week and whether this day is special
+        day_name, month_name, is_holiday, is_wknd, holiday_text = self._day_meta[(month_num, day_num)]
 
         c.setFillColor(colors["text"])
         c.setFont("DancingScript-Bold", 24)
@@ -687,214 +951,133 @@ class DiaryGenerator:
 
         # Add holiday/weekend indicator
         if is_holiday:
-            holiday_text = f"🎉 {self.holidays[date_obj]} 🎉"
             c.setFont("DancingScript-Bold", 14)
-            c.setFillColor(Color(0.8, 0.2, 0.2))
+            c.setFillColor(_rgba(0.8, 0.2, 0.2))
             holiday_width = c.stringWidth(holiday_text, "DancingScript-Bold", 14)
             c.drawString((self.width - holiday_width) / 2, self.height - 110, holiday_text)
         elif is_wknd:
             weekend_text = "🌟 Weekend! 🌟"
             c.setFont("DancingScript-Bold", 14)
-            c.setFillColor(Color(0.2, 0.2, 0.8))
+            c.setFillColor(_rgba(0.2, 0.2, 0.8))
             weekend_width = c.stringWidth(weekend_text, "DancingScript-Bold", 14)
             c.drawString((self.width - weekend_width) / 2, self.height - 110, weekend_text)
 
-        # Activities section
-        y_offset = -140 if (is_holiday or is_wknd) else -120
-        c.setFont("DancingScript-Bold", 25)
-        c.setFillColor(colors["text"])
-        c.drawString(50, self.height + y_offset, "Activities:")
-
-        # Create interactive text field for activities
-        activities_x, activities_y = 50, self.height + y_offset - 160
-        activities_w, activities_h = self.width - 150, 150
-
-        try:
-            # Try to create an interactive form field
-            tr = Color(100, 0, 0, 0.0)
-            c.acroForm.textfield(
-                name=f'activities_{month_num:02d}{day_num:02d}',
-                tooltip='Enter your activities for this day',
-                x=activities_x, y=activities_y,
-                width=activities_w, height=activities_h,
-                borderStyle='inset',
-                forceBorder=True,
-                fontName='Helvetica',
-                fontSize=10,
-                textColor=colors["text"],
-#                fillColor=colors["primary"],
-                fillColor=tr,
-                borderWidth=1,
-                fieldFlags='multiline'
-            )
-        except AttributeError:
-            # Fallback: Draw visual text area if acroForm not available
-            c.setFillColor(colors["primary"])
-            c.setStrokeColor(colors["accent"])
-            c.setLineWidth(1)
-            c.rect(activities_x, activities_y, activities_w, activities_h, fill=1, stroke=1)
-
-            # Add lines for writing
-            c.setStrokeColor(colors["accent"])
-            c.setLineWidth(0.5)
-            line_spacing = 15
-            for i in range(1, int(activities_h / line_spacing)):
-                y = activities_y + activities_h - (i * line_spacing)
-                c.line(activities_x + 10, y, activities_x + activities_w - 10, y)
-
-            # Add placeholder text
-            c.setFillColor(Color(0.6, 0.6, 0.6))
-            c.setFont("DancingScript-Bold", 10)
-            c.drawString(activities_x + 15, activities_y + activities_h - 15, "Write your activities here...")
-
-        # Notes section
-        notes_y_offset = y_offset - 240
-        c.setFont("DancingScript-Bold", 25)
-        c.setFillColor(colors["text"])
-        c.drawString(50, self.height + notes_y_offset, "Notes:")
-
-        # Create interactive text field for notes
-        notes_x, notes_y = 50, self.height + notes_y_offset - 160
-        notes_w, notes_h = self.width - 150, 150
-
-        try:
-            # Try to create an interactive form field
-            tr=Color(100,0,0,0.0)
-            c.acroForm.textfield(
-                name=f'notes_{month_num:02d}{day_num:02d}',
-                tooltip='Enter your notes for this day',
-                x=notes_x, y=notes_y,
-                width=notes_w, height=notes_h,
-                borderStyle='inset',
-                forceBorder=True,
-                fontName='Helvetica',
-                fontSize=20,
-                textColor=colors["text"],
-#                fillColor=colors["primary"],
-                fillColor=tr,
-                borderWidth=1,
-                fieldFlags='multiline'
-            )
-        except AttributeError:
-            # Fallback: Draw visual text area if acroForm not available
-            c.setFillColor(colors["primary"])
-            c.setStrokeColor(colors["accent"])
-            c.setLineWidth(1)
-            c.rect(notes_x, notes_y, notes_w, notes_h, fill=1, stroke=1)
-
-            # Add lines for writing
-            c.setStrokeColor(colors["accent"])
-            c.setLineWidth(0.5)
-            line_spacing = 15
-            for i in range(1, int(notes_h / line_spacing)):
-                y = notes_y + notes_h - (i * line_spacing)
-                c.line(notes_x + 10, y, notes_x + notes_w - 10, y)
-
-            # Add placeholder text
-            c.setFillColor(Color(0.6, 0.6, 0.6))
-            c.setFont("DancingScript-Regular", 10)
-            c.drawString(notes_x + 15, notes_y + notes_h - 15, "Write your notes here...")
+        # Activities and notes sections
+        layout = self._day_layouts[is_holiday or is_wknd]
+        field_styles = self._day_field_styles[season]
+        use_acroform = hasattr(c, 'acroForm')
+        for kind, heading, placeholder, placeholder_font in DAY_SECTIONS:
+            self._draw_day_section(c, use_acroform, layout, kind, heading,
+                                   f'{kind}_{month_num:02d}{day_num:02d}', field_styles[kind],
+                                   placeholder, placeholder_font, colors)
 
         # Add wisdom quote at bottom
         quote = self.get_unique_quote()
-        c.setFont("DancingScript-Regular", 12)
         c.setFillColor(colors["text"])
-        quote_lines = self.wrap_text(quote, 400, "DancingScript-Regular", 10)
-        y_pos = 80
-        for line in quote_lines:
-            line_width = c.stringWidth(line, "DancingScript-Regular", 10)
-            c.drawString((self.width - line_width) / 2, y_pos, line)
-            y_pos -= 12
+        self.draw_quote(c, quote, "DancingScript-Regular", 12, 80, 12)
 
         c.showPage()
 
     def generate_diary(self, filename):
         enc=self.enc
         """Generate the complete diary PDF"""
-        c = canvas.Canvas(filename, pagesize=A4,encrypt=enc)
+        c = canvas.Canvas(filename, pagesize=A4,encrypt=enc, pageCompression=1)
+        if hasattr(c, 'acroForm'):
+            _share_form_fonts(c.acroForm)
 
-        print(f"Generating enhanced diary for {self.year}...")
-        print(f"Holidays included: {len(self.holidays)} US Federal Holidays")
-        print("Weekend support: All Saturdays and Sundays marked")
+        self.log(f"Generating enhanced diary for {self.year}...")
+        self.log(f"Holidays included: {len(self.holidays)} US Federal Holidays")
+        self.log("Weekend support: All Saturdays and Sundays marked")
 
         # Create cover page
-        print("Creating cover page with seasonal background...")
+        self.log("Creating cover page with seasonal background...")
         self.create_cover_page(c)
 
-        print("Creating personal information pages...")
+        self.log("Creating personal information pages...")
         self.personal_info_manager.generate_all_personal_info_pages(c)
 
         # Create month pages
         for month in range(1, 13):
-            season = SeasonalTheme.get_season(month)
             self.create_month_page(c, month)
 
-        # Create day pages
-        total_days = 366 if calendar.isleap(self.year) else 365
+        # Create day pages, in date order from the per-year day table
+        total_days = len(self._day_meta)
         day_count = 0
 
-        for month in range(1, 13):
-            days_in_month = calendar.monthrange(self.year, month)[1]
-            for day in range(1, days_in_month + 1):
-                day_count += 1
-               # if day_count % 50 == 0:
-               #     print(f"Creating day pages with seasonal backgrounds... ({day_count}/{total_days})")
-                self.create_day_page(c, month, day)
+        for month, day in self._day_meta:
+            day_count += 1
+           # if day_count % 50 == 0:
+           #     self.log(f"Creating day pages with seasonal backgrounds... ({day_count}/{total_days})")
+            self.create_day_page(c, month, day)
             # Add personal info pages
 #            if hasattr(self, 'personal_info_manager'):
 #                self.personal_info_manager.generate_all_personal_info_pages(c)
 
         c.save()
         print(f"\n✨ Enhanced Diary generated successfully: {filename}")
-        print(f"📊 Total pages: {1 + 12 + total_days}")
-        print(f"🎨 Features included:")
-        print(f"   • Seasonal backgrounds for all 12 months")
-        print(f"   • {len(self.holidays)} US Federal Holidays marked")
-        print(f"   • All weekends (Saturdays & Sundays) highlighted")
-        print(f"   • Interactive navigation between months and days")
-        print(f"   • Fillable form fields for activities and notes")
+        self.log(f"📊 Total pages: {1 + 12 + total_days}")
+        self.log(f"🎨 Features included:")
+        self.log(f"   • Seasonal backgrounds for all 12 months")
+        self.log(f"   • {len(self.holidays)} US Federal Holidays marked")
+        self.log(f"   • All weekends (Saturdays & Sundays) highlighted")
+        self.log(f"   • Interactive navigation between months and days")
+        self.log(f"   • Fillable form fields for activities and notes")
 
         # Show background mode used
         if self.background_gen.use_images:
-            print(f"   • External image backgrounds from 'images/' folder")
+            self.log(f"   • External image backgrounds from 'images/' folder")
         else:
-            print(f"   • Generated programmatic backgrounds")
+            self.log(f"   • Generated programmatic backgrounds")
+
+        self.log(f"\n🖥️  To use the clickable navigation:")
+        self.log("   1. Open the PDF in Firefox: firefox diary_2025.pdf")
+        self.log("   2. Or use Chrome: google-chrome diary_2025.pdf")
+        self.log("   3. Click on month tabs to navigate between months")
+        self.log("   4. Click on calendar dates to jump to specific days")
+        self.log("   5. Holidays shown in red, weekends in blue")
+
+def _register_font(name, path):
+    """Register a TrueType font, skipping the file parse if the name is already known"""
+    if name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(name, path))
+
+_font_family_registered = False
 
-        print(f"\n🖥️  To use the clickable navigation:")
-        print("   1. Open the PDF in Firefox: firefox diary_2025.pdf")
-        print("   2. Or use Chrome: google-chrome diary_2025.pdf")
-        print("   3. Click on month tabs to navigate between months")
-        print("   4. Click on calendar dates to jump to specific days")
-        print("   5. Holidays shown in red, weekends in blue")
+def _register_font_family(normal, bold):
+    """Register the DancingScript family once per process"""
+    global _font_family_registered
+    if not _font_family_registered:
+        pdfmetrics.registerFontFamily('DancingScript', normal=normal, bold=bold)
+        _font_family_registered = True
 
 def main():
+    # Status output is opt-in; the year is the only other argument
+    args = sys.argv[1:]
+    verbose = "--verbose" in args or "-v" in args
+    args = [arg for arg in args if arg not in ("--verbose", "-v")]
+    log = print if verbose else _quiet
 
     # Register the fonts correctly
     try:
         # Register regular font
-        pdfmetrics.registerFont(TTFont('DancingScript-Regular', 'myfonts/static/DancingScript-Regular.ttf'))
-        print("✓ Registered DancingScript-Regular")
+        _register_font('DancingScript-Regular', 'myfonts/static/DancingScript-Regular.ttf')
+        log("✓ Registered DancingScript-Regular")
 
         # Try to register bold font if it exists
         try:
-            pdfmetrics.registerFont(TTFont('DancingScript-Bold', 'myfonts/static/DancingScript-Bold.ttf'))
-            print("✓ Registered DancingScript-Bold")
+            _register_font('DancingScript-Bold', 'myfonts/static/DancingScript-Bold.ttf')
+            log("✓ Registered DancingScript-Bold")
 
             # Register font family with both variants
-            from reportlab.pdfbase.pdfmetrics import registerFontFamily
-            registerFontFamily('DancingScript',
-                           normal='DancingScript-Regular',
-                           bold='DancingScript-Bold')
-            print("✓ Registered DancingScript font family")
+            _register_font_family(normal='DancingScript-Regular', bold='DancingScript-Bold')
+            log("✓ Registered DancingScript font family")
 
         except Exception as e:
             print(f"! Bold font not found: {e}")
             print("! Using regular font for all text")
             # Register family with just regular font
-            from reportlab.pdfbase.pdfmetrics import registerFontFamily
-            registerFontFamily('DancingScript',
-                           normal='DancingScript-Regular',
-                           bold='DancingScript-Regular')  # Use regular for bold too
+            _register_font_family(normal='DancingScript-Regular',
+                                  bold='DancingScript-Regular')  # Use regular for bold too
 
     except Exception as e:
         print(f"Error registering fonts: {e}")
@@ -902,8 +1085,8 @@ def main():
         sys.exit(1)
 #==============================================================================================================================================
 
-    if len(sys.argv) != 2:
-        print("Usage: python enhanced_diary.py <year>")
+    if len(args) != 1:
+        print("Usage: python enhanced_diary.py <year> [--verbose]")
         print("Example: python enhanced_diary.py 2025")
         print("\nOptional: Place seasonal background images in 'images/' folder:")
         print("  - images/winter_bg.jpg")
@@ -914,7 +1097,7 @@ def main():
         sys.exit(1)
 
     try:
-        year = int(sys.argv[1])
+        year = int(args[0])
         if year < 1900 or year > 2100:
             print("Please enter a year between 1900 and 2100")
             sys.exit(1)
@@ -926,7 +1109,7 @@ def main():
 
     enc=get_secure_password_for_diary()
     # Generate diary
-    generator = DiaryGenerator(year,enc)
+    generator = DiaryGenerator(year,enc, verbose)
     filename = f"diary_{year}.pdf"
     generator.generate_diary(filename)
 